@@ -144,4 +144,132 @@ def compare_budget_vs_actual(budget: dict, transactions: list, target_month: str
             'percent_over': round(((actual_amount - planned_amount) / planned_amount * 100), 1) if planned_amount > 0 else 0
         }
     
-    return comparison
\ No newline at end of file
+    return comparison
+
+
+def _parse_month(month: str):
+    """
+    Parses month key of a transaction.
+    Args:
+        month (str): Month in YYYY-MM format
+    Returns:
+        Tuple (year, month number) or None if month is malformed
+    """
+    if len(month) != 7 or month[4] != '-' or not month[:4].isdigit() or not month[5:].isdigit():
+        return None
+    month_number = int(month[5:])
+    if not 1 <= month_number <= 12:
+        return None
+    return int(month[:4]), month_number
+
+
+def _previous_months(month: str, count: int) -> list:
+    """
+    Returns calendar months preceding the given one.
+    Args:
+        month (str): Month in YYYY-MM format
+        count (int): Number of months to return
+    Returns:
+        List of months in YYYY-MM format, nearest first
+    """
+    year, month_number = _parse_month(month)
+    result = []
+    for _ in range(count):
+        month_number -= 1
+        if month_number == 0:
+            year -= 1
+            month_number = 12
+        result.append(f"{year:04d}-{month_number:02d}")
+    return result
+
+
+def compare_budget_by_month(budget: dict, transactions: list, monthly_budgets: dict = None, rolling_window: int = None) -> dict:
+    """
+    Compares budget with actual spending for every month and category at once.
+    Transactions are scanned in a single pass. Each cell matches the result
+    of compare_budget_vs_actual for that month and category.
+    Args:
+        budget (dict): Budget from create_budget_template
+        transactions (list): Actual transactions to compare
+        monthly_budgets (dict): Budgets for specific months, month -> budget (optional)
+        rolling_window (int): Plan each month as average actual spending
+            of this many preceding calendar months, positive (optional).
+            Months without transactions count as zero spending, months
+            before the first month with data are not counted. The first
+            month and months with malformed dates use budget instead
+    Returns:
+        Dictionary with 'months' and 'categories' lists and 'planned', 'actual',
+        'status', 'percent_over' matrices indexed as [month][category].
+        Months run without gaps from the first to the last month with data;
+        months with malformed dates get their own rows
+    """
+    if rolling_window is not None and (isinstance(rolling_window, bool) or not isinstance(rolling_window, int)
+                                       or rolling_window <= 0):
+        raise ValueError(f"rolling_window must be a positive integer: {rolling_window}")
+
+    monthly_budgets = monthly_budgets or {}
+
+    categories = [category for category in budget if category != ru.SAVINGS_CATEGORY]
+    for month_budget in monthly_budgets.values():
+        for category in month_budget:
+            if category != ru.SAVINGS_CATEGORY and category not in categories:
+                categories.append(category)
+    category_index = {category: i for i, category in enumerate(categories)}
+
+    actual_by_month = {}
+
+    for transaction in transactions:
+        month = transaction['date'][:7]
+        if month not in actual_by_month:
+            actual_by_month[month] = [0] * len(categories)
+
+        if transaction['amount'] < 0:
+            i = category_index.get(transaction['category'])
+            if i is not None:
+                actual_by_month[month][i] += abs(transaction['amount'])
+
+    valid_months = sorted(month for month in actual_by_month if _parse_month(month))
+    months = set(actual_by_month)
+    if valid_months:
+        first_month, last_month = valid_months[0], valid_months[-1]
+        month = last_month
+        while month > first_month:
+            months.add(month)
+            month = _previous_months(month, 1)[0]
+    months = sorted(months)
+
+    empty_row = [0] * len(categories)
+    planned = []
+    actual = []
+    status = []
+    percent_over = []
+
+    for month in months:
+        actual_row = actual_by_month.get(month, empty_row)
+
+        if month in monthly_budgets:
+            month_budget = monthly_budgets[month]
+            planned_row = [month_budget.get(category, 0) for category in categories]
+        elif rolling_window and _parse_month(month) and month > first_month:
+            previous = [month_key for month_key in _previous_months(month, rolling_window)
+                        if month_key >= first_month]
+            planned_row = [round(sum(actual_by_month.get(month_key, empty_row)[i] for month_key in previous) / len(previous))
+                           for i in range(len(categories))]
+        else:
+            planned_row = [budget.get(category, 0) for category in categories]
+
+        planned.append(planned_row)
+        actual.append([round(amount, 2) for amount in actual_row])
+        status.append(['within_budget' if actual_amount <= planned_amount else 'exceeded'
+                       for planned_amount, actual_amount in zip(planned_row, actual_row)])
+        percent_over.append([round(((actual_amount - planned_amount) / planned_amount * 100), 1) if planned_amount > 0 else 0
+                             for planned_amount, actual_amount in zip(planned_row, actual_row)])
+
+    return {
+        'months': months,
+        'categories': categories,
+        'planned': planned,
+        'actual': actual,
+        'status': status,
+        'percent_over': percent_over
+    }
\ No newline at end of file
@@ -6,6 +6,8 @@ Supports CSV and JSON formats with data normalization.
 import csv
 import json
 import os.path
+from bisect import bisect_right
+from typing import Optional
 import ru_local as ru
 
 def read_csv_file(filename: str) -> list[dict]:
@@ -35,7 +37,8 @@ def read_csv_file(filename: str) -> list[dict]:
                     "date": row.get('date', ''),
                     "amount": amount,
                     "description": row.get('description', ''),
-                    "type": transaction_type
+                    "type": transaction_type,
+                    "currency": normalize_currency(row.get('currency'))
                 }
                 transactions.append(transaction)
                 
@@ -67,7 +70,8 @@ def read_json_file(filename: str) -> list[dict]:
                         "date": item.get("date", ""),
                         "amount": float(item.get("amount", 0)),
                         "description": item.get("description", ""),
-                        "type": item.get("type", ru.EXPENSE_TYPE if float(item.get("amount", 0)) < 0 else ru.INCOME_TYPE)
+                        "type": item.get("type", ru.EXPENSE_TYPE if float(item.get("amount", 0)) < 0 else ru.INCOME_TYPE),
+                        "currency": normalize_currency(item.get("currency"))
                     }
                     normalized_transactions.append(transaction)
                 return normalized_transactions
@@ -85,12 +89,128 @@ def read_json_file(filename: str) -> list[dict]:
         print(f"{ru.JSON_READ_ERROR}: {e}")
         return []
 
-def import_financial_data(filename: str) -> list[dict]:
+def normalize_currency(value) -> str:
+    """
+    Convert currency code from input data to canonical form.
+    Args:
+        value: Currency code as read from file, may be empty
+    Returns:
+        Upper-case currency code without spaces, base currency if empty
+    """
+    if value is None:
+        return ru.BASE_CURRENCY
+    currency = str(value).strip().upper()
+    return currency or ru.BASE_CURRENCY
+
+
+def load_exchange_rates(filename: str) -> dict:
+    """
+    Read exchange rate table from CSV file with date,currency,rate columns.
+    Rate is the amount of base currency for one unit of the currency.
+    Args:
+        filename (str): Name of the CSV file with rates
+    Returns:
+        Dictionary currency -> (sorted list of dates, list of rates)
+    """
+    raw_rates = {}
+
+    try:
+        with open(filename, 'r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+
+            for row in reader:
+                try:
+                    currency = normalize_currency(row['currency'])
+                    rate = float(row['rate'])
+                    date = row['date'].strip()
+                    if rate <= 0 or not str(row['currency'] or '').strip():
+                        raise ValueError(row)
+                except (ValueError, KeyError, AttributeError, TypeError):
+                    print(f"{ru.INVALID_RATE}: {row}")
+                    continue
+
+                raw_rates.setdefault(currency, {})[date] = rate
+
+    except FileNotFoundError:
+        print(ru.FILE_NOT_FOUND)
+        return {}
+    except Exception as e:
+        print(f"{ru.RATES_READ_ERROR}: {e}")
+        return {}
+
+    rates = {}
+    for currency, by_date in raw_rates.items():
+        dates = sorted(by_date)
+        rates[currency] = (dates, [by_date[date] for date in dates])
+
+    return rates
+
+
+def find_exchange_rate(rates: dict, currency: str, date: str) -> Optional[float]:
+    """
+    Find the latest known rate of currency on or before the given date.
+    Args:
+        rates (dict): Rate table from load_exchange_rates
+        currency (str): Currency code
+        date (str): Date in YYYY-MM-DD format
+    Returns:
+        Rate as float or None if no rate is known for that date
+    """
+    if currency == ru.BASE_CURRENCY:
+        return 1.0
+
+    if currency not in rates:
+        return None
+
+    dates, values = rates[currency]
+    index = bisect_right(dates, date[:10])
+    if index == 0:
+        return None
+    return values[index - 1]
+
+
+def convert_to_base_currency(transactions: list[dict], rates: dict) -> list[dict]:
+    """
+    Convert amounts of all transactions to the base currency in one pass.
+    Rates are looked up once per (currency, date) pair.
+    Args:
+        transactions (list): List of transactions in UNIFIED FORMAT
+        rates (dict): Rate table from load_exchange_rates
+    Returns:
+        List of transactions with amounts in base currency
+    """
+    rate_cache = {}
+    converted_transactions = []
+
+    for transaction in transactions:
+        currency = transaction.get('currency', ru.BASE_CURRENCY)
+        key = (currency, transaction['date'])
+
+        if key not in rate_cache:
+            rate_cache[key] = find_exchange_rate(rates, currency, transaction['date'])
+        rate = rate_cache[key]
+
+        if rate is None:
+            print(f"{ru.RATE_NOT_FOUND}: {transaction}")
+            continue
+
+        converted_transaction = transaction.copy()
+        converted_transaction['original_amount'] = transaction['amount']
+        converted_transaction['original_currency'] = currency
+        converted_transaction['amount'] = round(transaction['amount'] * rate, 2)
+        converted_transaction['currency'] = ru.BASE_CURRENCY
+        converted_transactions.append(converted_transaction)
+
+    return converted_transactions
+
+
+def import_financial_data(filename: str, rates_filename: str = None) -> list[dict]:
     """
     Universal function for importing financial data.
     Returns data in UNIFIED FORMAT for the entire system.
     Args:
         filename (str): Name of data file (.csv or .json)
+        rates_filename (str): CSV file with exchange rates (optional)
     Returns:
         List of transactions in UNIFIED FORMAT:
     """
@@ -107,7 +227,7 @@ def import_financial_data(filename: str) -> list[dict]:
         return []
     
     validated_transactions = []
-    required_fields = ['date', 'amount', 'description', 'type']
+    required_fields = ['date', 'amount', 'description', 'type', 'currency']
     
     for transaction in transactions:
         if all(field in transaction for field in required_fields):
@@ -115,5 +235,11 @@ def import_financial_data(filename: str) -> list[dict]:
         else:
             print(f"{ru.INCOMPLETE_DATA}: {transaction}")
     
+    has_foreign_currency = any(transaction['currency'] != ru.BASE_CURRENCY
+                               for transaction in validated_transactions)
+    if rates_filename or has_foreign_currency:
+        rates = load_exchange_rates(rates_filename) if rates_filename else {}
+        validated_transactions = convert_to_base_currency(validated_transactions, rates)
+    
     print(f"{ru.IMPORT_SUCCESS} {len(validated_transactions)} {ru.TRANSACTION_FORMAT}")
     return validated_transactions
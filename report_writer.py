@@ -0,0 +1,232 @@
+"""
+Module for building and rendering financial reports.
+Report model is built once from precomputed results and rendered
+by pluggable writers (text, JSON, CSV) into a single buffer.
+"""
+
+import csv
+import io
+import json
+import ru_local as ru
+
+def build_report(stats: dict, category_stats: dict, budget: dict, spending_analysis: dict,
+                 budget_comparison: dict, time_analysis: dict) -> dict:
+    """
+    Builds report model from precomputed analysis results.
+    Args:
+        stats (dict): Basic statistics from calculate_basic_stats
+        category_stats (dict): Category statistics from calculate_by_category
+        budget (dict): Budget from create_budget_template
+        spending_analysis (dict): Result from analyze_historical_spending
+        budget_comparison (dict): Result from compare_budget_vs_actual
+        time_analysis (dict): Time-based analysis from analyze_by_time
+    Returns:
+        Dictionary with report data ready for rendering
+    """
+    categories = []
+    for category, data in category_stats.items():
+        categories.append({
+            'category': category,
+            'total_amount': data.get('total_amount', 0),
+            'percentage': data.get('percentage', 0),
+            'transaction_count': data.get('transaction_count', 0)
+        })
+
+    budget_lines = []
+    for category, planned in budget.items():
+        historical = spending_analysis.get(category, {}).get('avg_monthly', 0)
+        if category != ru.SAVINGS_CATEGORY and historical > 0:
+            change = ((planned - historical) / historical) * 100
+        else:
+            change = None
+        budget_lines.append({
+            'category': category,
+            'planned': planned,
+            'historical_avg': historical,
+            'change_percent': change
+        })
+
+    exceeded = [category for category, data in budget_comparison.items()
+                if data.get('status') == 'exceeded']
+
+    months = []
+    for month, data in list(time_analysis.items())[-3:]:
+        months.append({
+            'month': month,
+            'income': data['income'],
+            'expenses': data['expenses']
+        })
+
+    return {
+        'stats': {
+            'total_income': stats.get('total_income', 0),
+            'total_expenses': stats.get('total_expenses', 0),
+            'balance': stats.get('balance', 0),
+            'transaction_count': stats.get('transaction_count', 0)
+        },
+        'categories': categories,
+        'budget': budget_lines,
+        'exceeded': exceeded,
+        'savings_goal': stats.get('total_income', 0) * 0.1,
+        'months': months
+    }
+
+
+def _format_amount(value: float, width: int) -> str:
+    """
+    Formats amount with space as thousands separator.
+    Args:
+        value (float): Amount to format
+        width (int): Minimal field width
+    Returns:
+        Formatted amount as string
+    """
+    return f"{value:>{width},.0f}".replace(',', ' ')
+
+
+def write_text_report(report: dict, output) -> None:
+    """
+    Writes report in human-readable text format.
+    Args:
+        report (dict): Report from build_report
+        output: Text stream to write into
+    """
+    stats = report['stats']
+    lines = [
+        "",
+        "=" * 60,
+        f"💰 {ru.FINANCIAL_REPORT}",
+        "=" * 60,
+        "",
+        f"📊 {ru.BASIC_INDICATORS}",
+        f"│   💵 {ru.INCOME}:     {_format_amount(stats['total_income'], 12)} руб.",
+        f"│   💸 {ru.EXPENSES}:    {_format_amount(stats['total_expenses'], 12)} руб.",
+        f"│   ⚖️ {ru.BALANCE}:     {_format_amount(stats['balance'], 12)} руб.",
+        f"│   📈 {ru.TRANSACTION_COUNT}:   {stats['transaction_count']:>12}",
+    ]
+
+    if report['categories']:
+        lines.append("")
+        lines.append(f"  {ru.CATEGORY_SPENDING}:")
+        for data in report['categories']:
+            lines.append(f"│     {data['category']:<15} {_format_amount(data['total_amount'], 8)} {ru.RUBLES} "
+                         f"({data['percentage']:>5.1f}%) {data['transaction_count']:>3} {ru.OPERATIONS}")
+
+    if report['budget']:
+        lines.append("")
+        lines.append(f"🎯 {ru.NEXT_MONTH_BUDGET}:")
+
+        for data in report['budget']:
+            if data['category'] == ru.SAVINGS_CATEGORY:
+                lines.append(f"│   💰 {ru.SAVINGS}:{_format_amount(data['planned'], 12)} {ru.RUBLES}")
+            elif data['change_percent'] is not None:
+                change = data['change_percent']
+                trend = f"📉 {ru.DECREASE_TREND}" if change < 0 else f"📈 {ru.INCREASE_TREND}"
+                planned = _format_amount(data['planned'], 8)
+                lines.append(f"│     {data['category']:<15} {planned} {ru.RUBLES} ({trend} {ru.ON} {abs(change):>3.0f}%)")
+            else:
+                planned = _format_amount(data['planned'], 8)
+                lines.append(f"│     {data['category']:<15} {planned} {ru.RUBLES}")
+
+        lines.append("")
+        lines.append(f"💡 {ru.RECOMMENDATIONS}:")
+        if report['exceeded']:
+            lines.append(f"│   ⚠️  {ru.FOCUS_SPENDING}: {', '.join(report['exceeded'][:2])}")
+        else:
+            lines.append(f"│   ✅ {ru.BUDGET_MAINTAINED}")
+
+        if report['savings_goal'] > 0:
+            lines.append(f"│   🎯 {ru.SAVINGS_GOAL}: {_format_amount(report['savings_goal'], 8)} {ru.RUBLES_IN_MONTH}")
+
+    if report['months']:
+        lines.append("")
+        lines.append(f"📅 {ru.TIME_ANALYSIS}:")
+        for data in report['months']:
+            lines.append(f"│   📆 {data['month']}:  {_format_amount(data['income'], 8)} {ru.RUBLES}  "
+                         f"{_format_amount(data['expenses'], 8)} {ru.RUBLES}")
+
+    lines.append("")
+    lines.append("=" * 60)
+    lines.append(f"🎉 {ru.ANALYSIS_COMPLETED} 😊")
+    lines.append("=" * 60)
+
+    output.write("\n".join(lines))
+    output.write("\n")
+
+
+def _round_report(report: dict) -> dict:
+    """
+    Returns copy of report with computed values rounded for data formats.
+    Args:
+        report (dict): Report from build_report
+    Returns:
+        Report with rounded change percents and savings goal
+    """
+    rounded = dict(report)
+    rounded['budget'] = [
+        {**data, 'change_percent': None if data['change_percent'] is None else round(data['change_percent'], 1)}
+        for data in report['budget']
+    ]
+    rounded['savings_goal'] = round(report['savings_goal'], 2)
+    return rounded
+
+
+def write_json_report(report: dict, output) -> None:
+    """
+    Writes report as JSON document.
+    Args:
+        report (dict): Report from build_report
+        output: Text stream to write into
+    """
+    json.dump(_round_report(report), output, ensure_ascii=False, indent=2)
+    output.write("\n")
+
+
+def write_csv_report(report: dict, output) -> None:
+    """
+    Writes report as CSV table with section,name,field,value columns.
+    Args:
+        report (dict): Report from build_report
+        output: Text stream to write into
+    """
+    report = _round_report(report)
+    writer = csv.writer(output, lineterminator="\n")
+    writer.writerow(['section', 'name', 'field', 'value'])
+
+    for field, value in report['stats'].items():
+        writer.writerow(['stats', '', field, value])
+
+    for section, key in (('categories', 'category'), ('budget', 'category'), ('months', 'month')):
+        for data in report[section]:
+            for field, value in data.items():
+                if field != key:
+                    writer.writerow([section, data[key], field, '' if value is None else value])
+
+    for category in report['exceeded']:
+        writer.writerow(['exceeded', category, 'status', 'exceeded'])
+
+    writer.writerow(['savings_goal', '', 'amount', report['savings_goal']])
+
+
+REPORT_WRITERS = {
+    'text': write_text_report,
+    'json': write_json_report,
+    'csv': write_csv_report
+}
+
+
+def render_report(report: dict, report_format: str = 'text') -> str:
+    """
+    Renders report into a single string using the selected writer.
+    Args:
+        report (dict): Report from build_report
+        report_format (str): One of REPORT_WRITERS keys
+    Returns:
+        Rendered report as string
+    """
+    if report_format not in REPORT_WRITERS:
+        raise ValueError(f"Unsupported report format: {report_format}")
+
+    buffer = io.StringIO()
+    REPORT_WRITERS[report_format](report, buffer)
+    return buffer.getvalue()
@@ -10,8 +10,12 @@ UNSUPPORTED_FORMAT = "Ошибка: неподдерживаемый форма
 INCOMPLETE_DATA = "Предупреждение: Пропущена транзакция с неполными данными"
 IMPORT_SUCCESS = "Успешно импортировано"
 TRANSACTION_FORMAT = "транзакций в едином формате"
+INVALID_RATE = "Некорректная строка в таблице курсов"
+RATES_READ_ERROR = "Ошибка при чтении файла курсов валют"
+RATE_NOT_FOUND = "Предупреждение: не найден курс валюты для транзакции"
 
 ENTER_FILENAME = "Введите имя файла с данными (CSV/JSON): "
+ENTER_RATES_FILENAME = "Введите имя файла с курсами валют (Enter - пропустить): "
 FINANCIAL_REPORT = "ФИНАНСОВЫЙ ОТЧЕТ"
 BASIC_INDICATORS = "ОСНОВНЫЕ ПОКАЗАТЕЛИ"
 INCOME = "Доходы"
@@ -42,6 +46,8 @@ SALARY = "зарплата"
 OTHER = "другое"
 SAVINGS_CATEGORY = "накопления"
 
+BASE_CURRENCY = "RUB"
+
 INCOME_TYPE = "доход"
 EXPENSE_TYPE = "расход"
 